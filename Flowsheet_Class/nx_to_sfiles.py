@@ -1,10 +1,16 @@
 import random
+from collections import defaultdict
+from itertools import chain
+from operator import itemgetter
 import networkx as nx
 import re
 import numpy as np
 
 random.seed(1)
 
+_NODE_NUMBER_SPLIT = re.compile(r'[-/]')
+_SIGNAL_NODE = re.compile(r'C-\d+')
+
 """
 Exposes functionality for writing SFILES (Simplified flowsheet input line entry system) strings
 Based on
@@ -583,6 +589,12 @@ def calc_graph_invariant(flowsheet):
         edge_information = nx.get_edge_attributes(flowsheet, 'tags')
         edge_information_col = {k: flatten(v['col']) for k, v in edge_information.items() if 'col' in v.keys() if
                                 v['col']}
+        # Group the first column tag of each edge by both of its nodes, so the tags of a node are looked up directly.
+        col_tags_by_node = defaultdict(list)
+        for (in_node, out_node), tag in edge_information_col.items():
+            col_tags_by_node[in_node].append(tag[0])
+            if out_node != in_node:
+                col_tags_by_node[out_node].append(tag[0])
 
         # 2. We afterwards sort the nested lists (same rank). This is the tricky part of breaking the ties.
         for pos, eq_ranked_nodes in enumerate(ranks_list):
@@ -599,17 +611,12 @@ def calc_graph_invariant(flowsheet):
                 # should not change the generalized SFILES).
                 sorted_edges = []
                 for k in range(0, len(eq_ranked_nodes)):
-                    edges = sorted(list(dfs_trees[k].edges), key=lambda element: (element[0], element[1]))
+                    edges = sorted(dfs_trees[k].edges)
                     edges = [(k.split(sep='-')[0], v.split(sep='-')[0]) for k, v in edges]
-                    sorted_edge = sorted(edges, key=lambda element: (element[0], element[1]))
-                    sorted_edge = [i for sub in sorted_edge for i in sub]
-
-                    edge_tags = []
-                    for edge, tag in edge_information_col.items():
-                        if edge[0] == eq_ranked_nodes[k] or edge[1] == eq_ranked_nodes[k]:
-                            edge_tags.append(tag[0])
+                    sorted_edge = sorted(edges)
+                    sorted_edge = list(chain.from_iterable(sorted_edge))
 
-                    edge_tags = ''.join(sorted(edge_tags))
+                    edge_tags = ''.join(sorted(col_tags_by_node.get(eq_ranked_nodes[k], [])))
                     if edge_tags:
                         sorted_edge.insert(0, edge_tags)
                     sorted_edges.append(sorted_edge)
@@ -690,12 +697,9 @@ def last_node_finder(sfiles):
         Name of last node.
     """
 
-    last_node = ''
-
-    for element in reversed(sfiles):
-        if element.startswith('(') and element.endswith(')'):
-            last_node = element[1:-1]
-            break
+    # Scan from the end and stop at the first node token.
+    last_node = next((element[1:-1] for element in reversed(sfiles)
+                      if element[:1] == '(' and element[-1:] == ')'), '')
 
     return last_node
 
@@ -759,10 +763,23 @@ def find_nested_indices(nested_list, node):
 
 
 def insert_element(lst, indices, value):
-    if len(indices) == 1:
-        lst.insert(indices[0] + 1, value)
-    else:
-        insert_element(lst[indices[0]], indices[1:], value)
+    """Inserts value in nested list after the element at the given nested indices.
+
+    Parameters
+    ----------
+    lst: list
+        List of lists.
+    indices: list
+        Nested indices of the element after which value is inserted.
+    value: str or list
+        Element to insert.
+    """
+
+    # Walk down to the innermost list instead of recursing per nesting level.
+    current = lst
+    for i in indices[:-1]:
+        current = current[i]
+    current.insert(indices[-1] + 1, value)
 
 
 def rank_by_dfs_tree(dfs_trees_generalized):
@@ -791,37 +808,33 @@ def rank_by_dfs_tree(dfs_trees_generalized):
         List of sorted nodes with previously equal ranks.
     """
 
-    output_nodes = {}
-    input_nodes = {}
-    signal_nodes = {}
-    other_nodes = {}
+    # Signal, output and input nodes share one list, since they are sorted by the same criteria. The bucket number as
+    # first sort criterion implies the order of first signal, then output and input nodes.
+    signal_output_input_nodes = []
+    other_nodes = []
 
     for n, s in dfs_trees_generalized.items():
-        succ_str = ''.join(list(s))
+        succ_len = len(s)
+        succ_str = ''.join(s)
+        node_number = int(_NODE_NUMBER_SPLIT.split(n)[1])
 
         if 'prod' in n:
-            output_nodes[n] = (len(dfs_trees_generalized[n]), succ_str)
+            signal_output_input_nodes.append(((1, -succ_len, succ_str, node_number), n))
         elif 'raw' in n:
-            input_nodes[n] = (len(dfs_trees_generalized[n]), succ_str)
-        elif bool(re.match(r'C-\d+', n)):
-            signal_nodes[n] = (len(dfs_trees_generalized[n]), succ_str)
+            signal_output_input_nodes.append(((2, -succ_len, succ_str, node_number), n))
+        elif _SIGNAL_NODE.match(n):
+            signal_output_input_nodes.append(((0, -succ_len, succ_str, node_number), n))
         else:
-            other_nodes[n] = (len(dfs_trees_generalized[n]), succ_str)
+            other_nodes.append(((succ_len, succ_str, node_number), n))
 
-    # Sort all dicts first according list length (input/output: long is better, other nodes: short is better->
+    # Sort first according list length (input/output: long is better, other nodes: short is better->
     # less in brackets), then generalized string alphabetically, then real node name (i.e. node number).
     # Real node name with numbering is only accessed if the generalized string (graph structure) is the same.
-    sorted_nodes = []
-    for d in [signal_nodes, output_nodes, input_nodes]:
-        # 3 sort criteria in that order list length (- sign), then generalized string alphabetically, then node number.
-        sorted_nodes_sub = sorted(d, key=lambda k: (-d[k][0], d[k][1], int(re.split('[-/]', k)[1])))
-        sorted_nodes.extend(sorted_nodes_sub)  # Implies the order of first signal then output and input nodes.
-
-    # Other nodes: 3 sort criteria in that order list length (+ sign), then generalized string alphabetically,
-    # then node number
-    sorted_nodes_sub = sorted(other_nodes,
-                              key=lambda k: (other_nodes[k][0], other_nodes[k][1], int(re.split('[-/]', k)[1])))
-    sorted_nodes.extend(sorted_nodes_sub)  # Implies the order of first signal, then output, input, and other nodes.
+    # Only the sort key is compared, so nodes with equal keys keep their order.
+    signal_output_input_nodes.sort(key=itemgetter(0))
+    other_nodes.sort(key=itemgetter(0))
+    # Implies the order of first signal, then output, input, and other nodes.
+    sorted_nodes = [n for _, n in signal_output_input_nodes] + [n for _, n in other_nodes]
 
     return sorted_nodes
 
@@ -851,6 +864,7 @@ def insert_signal_connections(edge_infos_signal, sfiles, nodes_position_setoffs_
 
     nr_pre_visited_signal = 0
     signal_nodes = [k[0] for k in edge_infos_signal.keys()]
+    signal_edges = list(edge_infos_signal)
     sfiles_flattened = flatten(sfiles)
     pos = {}
 
@@ -873,12 +887,16 @@ def insert_signal_connections(edge_infos_signal, sfiles, nodes_position_setoffs_
                 nodes_position_setoffs[k[1]] = 0
 
         # Sort the signal nodes according to their position in the SFILES.
-        signal_nodes_sorted = dict(sorted(pos.items()))
-        signal_nodes_sorted = list(signal_nodes_sorted.values())
+        signal_nodes_sorted = [v for _, v in sorted(pos.items())]
+        # First position of each signal node in the SFILES.
+        signal_nodes_order = {}
+        for i, n in enumerate(signal_nodes_sorted):
+            signal_nodes_order.setdefault(n, i)
 
-        edge_infos_signal = dict(sorted(edge_infos_signal.items(), key=lambda x: signal_nodes_sorted.index(x[0][0])))
+        # Signal edges (node1, node2) are inserted in the order of their signal nodes.
+        signal_edges = sorted(edge_infos_signal, key=lambda edge: signal_nodes_order[edge[0]])
 
-    for k, v in edge_infos_signal:
+    for k, v in signal_edges:
         nr_pre_visited_signal, special_edges, sfiles_part, sfiles = insert_cycle(nr_pre_visited_signal, sfiles, sfiles,
                                                                                  special_edges, nodes_position_setoffs,
                                                                                  nodes_position_setoffs_cycle, v, k,
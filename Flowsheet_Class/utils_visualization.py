@@ -25,16 +25,10 @@ def create_stream_table(graph, chemicalspecies, decimals):
     header.extend(chemicalspecies)
 
     table_data = [header]
-    for edge in graph.edges:
-        stream_list = []
-        stream_list.append(graph.get_edge_data(*edge)['processstream_name'])
-        stream_data = graph.get_edge_data(*edge)['processstream_data']
-        stream_list.append(edge)
-        for i in range(len(stream_data[0:3])):
-            stream_list.append(round(stream_data[i], decimals))
-        for i in range(len(stream_data[-1])):
-            stream_list.append(round(stream_data[-1][i], decimals))
-        table_data.append(stream_list)
+    for n1, n2, d in graph.edges(data=True):
+        stream_data = d['processstream_data']
+        table_data.append([d['processstream_name'], (n1, n2), *[round(value, decimals) for value in stream_data[0:3]],
+                           *[round(fraction, decimals) for fraction in stream_data[-1]]])
     table_streams = tabulate(table_data, headers='firstrow', tablefmt='grid')
     print(table_streams)
     return table_streams
@@ -52,21 +46,22 @@ def create_unit_table(graph, decimals):
     """
     unit_table_data = [
         ['Unit name', 'Unit type', 'Condition description', 'Condition']]
-    for node in graph.nodes:
+    for node, data in graph.nodes(data=True):
         node_list = []
         node_list.append(node)
-        node_list.append(graph.nodes(data=True)[node]['unit_type_specific'])
-        unit = graph.nodes(data=True)[node]['unit']
-        if graph.nodes(data=True)[node]['unit_type'] == 'hex':
+        node_list.append(data['unit_type_specific'])
+        unit = data['unit']
+        unit_type = data['unit_type']
+        if unit_type == 'hex':
             node_list.append('water inlet temperature')
             node_list.append(round(unit.water_temp_in, decimals))
-        elif graph.nodes(data=True)[node]['unit_type'] == 'r':
+        elif unit_type == 'r':
             node_list.append('length')
             node_list.append(round(unit.length, decimals))
-        elif graph.nodes(data=True)[node]['unit_type'] == 'col':
+        elif unit_type == 'col':
             node_list.append('distillation to feed ratio')
             node_list.append(round(unit.has_distillation_to_feed_ratio, decimals))
-        elif graph.nodes(data=True)[node]['unit_type'] == 'splt':
+        elif unit_type == 'splt':
             node_list.append('split ratio')
             node_list.append(round(unit.split_ratio, decimals))
         else:
@@ -93,18 +88,18 @@ def _add_positions(graph, flowsheet_size):
     # Save all feed nodes in a list (reason: the following algorithm always checks for all outgoing edges
     # and their successor nodes, starting with the first feeds. To come back to those later, they and their
     # position are saved in lists
-    save_nodes = [feed for feed in graph.nodes if graph.in_degree(feed) == 0]
+    save_nodes = [feed for feed, in_degree in graph.in_degree() if in_degree == 0]
     save_pos = []
-    y_coordinates = []  # List to save all y coordinates --> no nodes above each other
+    y_coordinates = set()  # Set to save all y coordinates --> no nodes above each other
     # Initialize a list for saving all nodes that have been updated
     updated_nodes = []
     i=0
     for _, feed in enumerate(save_nodes):
         # Update positions of all feeds
         nx.set_node_attributes(graph, {feed: {'pos': [0, i]}})
-        y_coordinates.append(i)
-        # Save position of all feeds
-        save_pos.append([0, i])
+        y_coordinates.add(i)
+        # Save position of all feeds (as tuple, positions are not modified in place)
+        save_pos.append((0, i))
         # Write feeds in updated_nodes list to check later, if they already have a position attribute
         # (necessary when dealing with recycles!)
         updated_nodes.append(feed)
@@ -132,9 +127,8 @@ def _add_positions(graph, flowsheet_size):
             # Only one next node
             next_node = edges[0][1]
             # Set position to the right
-            pos = pos[:]
-            pos[0] += 150
-            nx.set_node_attributes(graph, {next_node: {'pos': pos}})
+            pos = (pos[0] + 150, pos[1])
+            nx.set_node_attributes(graph, {next_node: {'pos': list(pos)}})
             # Write updated node into list to check later, if this node has already been updated
             updated_nodes.append(next_node)
             # Use the new node as the source-node for the next iteration
@@ -143,21 +137,19 @@ def _add_positions(graph, flowsheet_size):
         elif len(edges) == 2:
             # Two successor nodes: Positions are set to the right and up / down
             next_node = edges[0][1]
-            pos = pos[:]
-            pos_x = pos[0]
-            pos_y = pos[1]
-            pos[0] = pos_x + 200
-            pos[1] = pos_y + 100
+            pos_x, pos_y = pos
+            next_pos_y = pos_y + 100
             multiplier = 0.5
 
-            while pos[1] in y_coordinates:
+            while next_pos_y in y_coordinates:
                 # Quick fix to prevent multiple nodes directly above each other --> for side-streams a new y-coordinate
                 # is chosen that has not been used before
-                pos[1] = pos_y + 100 * multiplier
+                next_pos_y = pos_y + 100 * multiplier
                 multiplier = multiplier * 0.5
 
-            y_coordinates.append(pos[1])
-            nx.set_node_attributes(graph, {next_node: {'pos': pos}})
+            pos = (pos_x + 200, next_pos_y)
+            y_coordinates.add(next_pos_y)
+            nx.set_node_attributes(graph, {next_node: {'pos': list(pos)}})
             updated_nodes.append(next_node)
             # Save the first of the two nodes and its position in the save lists in order to come back to
             # them later
@@ -166,16 +158,16 @@ def _add_positions(graph, flowsheet_size):
 
             # Update the second node just like in the case with only one successor node
             next_node = edges[1][1]
-            pos = pos[:]
-            pos[1] -= 200
+            next_pos_y = pos[1] - 200
             multiplier = 0.5
 
-            while pos[1] in y_coordinates:
-                pos[1] = pos_y - 150 * multiplier
+            while next_pos_y in y_coordinates:
+                next_pos_y = pos_y - 150 * multiplier
                 multiplier = multiplier * 0.5
 
-            y_coordinates.append(pos[1])
-            nx.set_node_attributes(graph, {next_node: {'pos': pos}})
+            pos = (pos_x + 200, next_pos_y)
+            y_coordinates.add(next_pos_y)
+            nx.set_node_attributes(graph, {next_node: {'pos': list(pos)}})
             updated_nodes.append(next_node)
             node = next_node
 
@@ -259,14 +251,16 @@ def plot_flowsheet_pyflowsheet(graph, block=False, imagepath='flowsheet',  pfd_i
     pfd = Flowsheet(pfd_id, pfd_name, pfd_description)  # id, name, description
 
     # Intialize a dict to store all unit operations using the node-ids as keys
-    unit_dict = dict.fromkeys(list(graph.nodes))
+    unit_dict = {}
 
     # Loop over all nodes in the graph to create UnitOperation objects with the pyflowsheet package
     feed_count = 1
     product_count = 1
+    in_degrees = dict(graph.in_degree())
+    out_degrees = dict(graph.out_degree())
     for node_id, node in graph.nodes(data=True):
         # Find all feeds and assign them to a StreamFlag unit
-        if graph.in_degree(node_id) == 0:
+        if in_degrees[node_id] == 0:
             feed_name = 'Feed ' + str(feed_count)
             feed = StreamFlag(node_id, name=feed_name, position=node['pos'])
             feed.setTextAnchor(HorizontalLabelAlignment.Center, VerticalLabelAlignment.Center, (0, 5))  # Text in image
@@ -274,7 +268,7 @@ def plot_flowsheet_pyflowsheet(graph, block=False, imagepath='flowsheet',  pfd_i
             unit_dict[node_id] = feed
 
         # Find all products and assign them to a StreamFlag unit
-        elif graph.out_degree(node_id) == 0 and node_id[0] == 'I':
+        elif out_degrees[node_id] == 0 and node_id[0] == 'I':
             # Second condition in case a flowsheet does not end with IO unit but e.g. with 'X' (qick fix, there must be
             # a better way)
             product_name = 'Product ' + str(product_count)
@@ -289,12 +283,13 @@ def plot_flowsheet_pyflowsheet(graph, block=False, imagepath='flowsheet',  pfd_i
                 unit.setTextAnchor(HorizontalLabelAlignment.Center, VerticalLabelAlignment.Center, (0, 5))
             else:  # Use images for units
                 # Todo: is there a way to work around the if-else statement?
-                if node['unit_type'] == 'hex':
+                unit_type = node['unit_type']
+                if unit_type == 'hex':
                     unit = HeatExchanger(node_id, name=node_id, position=node['pos'])
-                elif node['unit_type'] == 'r':
+                elif unit_type == 'r':
                     unit = Vessel(node_id, name=node_id, position=node['pos'], angle=90)
                     unit.setTextAnchor(HorizontalLabelAlignment.Center, VerticalLabelAlignment.Center, (0, 5))
-                elif node['unit_type'] == 'col':
+                elif unit_type == 'col':
                     unit = Distillation(node_id, name=node_id, position=node['pos'], hasReboiler=False,
                                         hasCondenser=False)
                     unit.setTextAnchor(HorizontalLabelAlignment.Center, VerticalLabelAlignment.Center, (0, 5))
@@ -313,8 +308,8 @@ def plot_flowsheet_pyflowsheet(graph, block=False, imagepath='flowsheet',  pfd_i
             pfd.connect(stream_id, unit_1['Out'], unit_2['In'])
 
             # Set stream name position
-            pos0 = graph.nodes(data=True)[edge[0]]['pos']
-            pos1 = graph.nodes(data=True)[edge[1]]['pos']
+            pos0 = graph.nodes[edge[0]]['pos']
+            pos1 = graph.nodes[edge[1]]['pos']
             if pos0[1] > pos1[1]:
                 pfd.streams[stream_id].labelOffset = (15, 10)
             else:
@@ -327,23 +322,25 @@ def plot_flowsheet_pyflowsheet(graph, block=False, imagepath='flowsheet',  pfd_i
             unit_1 = unit_dict[edge[0]]
             unit_2 = unit_dict[edge[1]]
             stream_id = 'stream-' + str(count)
-            pos0 = graph.nodes(data=True)[edge[0]]['pos']
-            pos1 = graph.nodes(data=True)[edge[1]]['pos']
+            node_0 = graph.nodes[edge[0]]
+            node_1 = graph.nodes[edge[1]]
+            pos0 = node_0['pos']
+            pos1 = node_1['pos']
 
             # Save names of ports of each specific unit
             # Todo: is there a way to work around the if-else statement?
-            if graph.nodes(data=True)[edge[0]]['unit_type'] == 'hex':
+            if node_0['unit_type'] == 'hex':
                 port1 = 'TOut'
-            elif graph.nodes(data=True)[edge[0]]['unit_type'] == 'col':
+            elif node_0['unit_type'] == 'col':
                 if pos0[1] > pos1[1]:
                     port1 = 'LOut'
                 else:
                     port1 = 'VOut'
             else:
                 port1 = 'Out'
-            if graph.nodes(data=True)[edge[1]]['unit_type'] == 'hex':
+            if node_1['unit_type'] == 'hex':
                 port2 = 'TIn'
-            elif graph.nodes(data=True)[edge[1]]['unit_type'] == 'col':
+            elif node_1['unit_type'] == 'col':
                 port2 = 'Feed'
             else:
                 port2 = 'In'
@@ -12,11 +12,46 @@ import pickle
 
 import random
 random.seed(1)
+
+_NAME_RE = re.compile("([a-zA-Z]+)([0-9]+)")  # Node name and node number, e.g. HeatExchanger3
+_TAG_RE = re.compile(r'\{.*?\}')  # SFILES tags, e.g. {tout}
+
+
+def _convert_pickled_flowsheet(f):
+    """Loads a pickled flowsheet graph, converts it to SFILES and back to a graph and converts it to SFILES again.
+
+    Returns
+    -------
+    Number of edges of the loaded graph, first SFILES, flowsheet object, number of edges of the reconverted graph,
+    second SFILES.
+    """
+
+    with open(f, 'rb') as fh:
+        G = pickle.load(fh)
+    _node_names = list(G.nodes)
+    relabel_mapping = {}
+    for n in _node_names:
+        _full_name = _NAME_RE.match(n).groups()
+        _name = _full_name[0] # name without number
+        _num = _full_name[1]
+        relabel_mapping[n] = _name +'-'+ _num
+    G = nx.relabel_nodes(G, relabel_mapping)
+    flowsheet = Flowsheet(OntoCapeConformity=True)
+    flowsheet.state = G
+    edges_1 = flowsheet.state.number_of_edges()
+    flowsheet.convert_to_sfiles(version='v2', remove_hex_tags=True)
+    sfiles_1 = flowsheet.sfiles
+    flowsheet.create_from_sfiles(overwrite_nx=True, merge_HI_nodes=False)
+    edges_2 = flowsheet.state.number_of_edges()
+    flowsheet.convert_to_sfiles(version='v2', remove_hex_tags=True)
+    sfiles_2 = flowsheet.sfiles
+    return edges_1, sfiles_1, flowsheet, edges_2, sfiles_2
+
+
 class FlowsheetTests(unittest.TestCase):
 
     def test_flowsheet_generation(self):
         print(os.getcwd())
-        all_files = [join('Real_data/AspenPlus_pickle_files', f) for f in listdir('Real_data/AspenPlus_pickle_files') if isfile(join('Real_data/AspenPlus_pickle_files', f))]
         all_sfiles1 = []
         all_edges_1= []
         all_edges_2= []
@@ -25,103 +60,57 @@ class FlowsheetTests(unittest.TestCase):
         all_sfiles4 = []
         all_flowsheets = []
         failures = []
-        for i,f in enumerate(all_files):
-            if not i in [3,12,13,14,15,19]: # assertion errors (hex in_degree not = out_degree)
-                G = nx.read_gpickle(f)
-                G = nx.read_gpickle(f)
-                _node_names = list(G.nodes)
-                relabel_mapping = {}
-                for n in _node_names:
-                    r = re.compile("([a-zA-Z]+)([0-9]+)")
-                    _full_name = r.match(n).groups()
-                    _name = _full_name[0] # name without number
-                    _num = _full_name[1]
-                    relabel_mapping[n] = _name +'-'+ _num
-                G = nx.relabel_nodes(G, relabel_mapping)
-                sgs = [G.subgraph(c).copy() for c in nx.weakly_connected_components(G)]
-                flowsheet = Flowsheet(OntoCapeConformity=True)
-                flowsheet.state = G
-                all_edges_1.append(list(flowsheet.state.edges))
-                flowsheet.convert_to_sfiles(version='v2', remove_hex_tags=True)
-                sfiles_1 = flowsheet.sfiles
-                all_sfiles1.append(sfiles_1)
-                all_sfiles3.append(re.sub(r'\{.*?\}', '',sfiles_1))
-                flowsheet.create_from_sfiles(override_nx=True, merge_HI_nodes=False)
-                all_flowsheets.append(flowsheet)
-                all_edges_2.append(list(flowsheet.state.edges))
-                flowsheet.convert_to_sfiles(version='v2', remove_hex_tags=True)
-                sfiles_2=flowsheet.sfiles
-                all_sfiles2.append(sfiles_2)
-                all_sfiles4.append(re.sub(r'\{.*?\}', '',sfiles_2))
-            else:
-                failures.append(f)
-
-        all_files = [join('Real_data/DWSim_pickle_files', f) for f in listdir('Real_data/DWSim_pickle_files') if isfile(join('Real_data/DWSim_pickle_files', f))]
-        for i,f in enumerate(all_files):
-            if not i in [68,92]: # 68, 92 assertion error
-                G = nx.read_gpickle(f)
-                G = nx.read_gpickle(f)
-                _node_names = list(G.nodes)
-                relabel_mapping = {}
-                for n in _node_names:
-                    r = re.compile("([a-zA-Z]+)([0-9]+)")
-                    _full_name = r.match(n).groups()
-                    _name = _full_name[0] # name without number
-                    _num = _full_name[1]
-                    relabel_mapping[n] = _name +'-'+ _num
-                G = nx.relabel_nodes(G, relabel_mapping)
-                sgs = [G.subgraph(c).copy() for c in nx.weakly_connected_components(G)]
-                flowsheet = Flowsheet(OntoCapeConformity=True)
-                flowsheet.state = G
-                all_edges_1.append(list(flowsheet.state.edges))
-                flowsheet.convert_to_sfiles(version='v2', remove_hex_tags=True)
-                sfiles_1 = flowsheet.sfiles
-                all_sfiles1.append(sfiles_1)
-                all_sfiles3.append(re.sub(r'\{.*?\}', '',sfiles_1))
-                flowsheet.create_from_sfiles(override_nx=True, merge_HI_nodes=False)
-                all_flowsheets.append(flowsheet)
-                all_edges_2.append(list(flowsheet.state.edges))
-                flowsheet.convert_to_sfiles(version='v2', remove_hex_tags=True)
-                sfiles_2=flowsheet.sfiles
-                all_sfiles2.append(sfiles_2)
-                all_sfiles4.append(re.sub(r'\{.*?\}', '',sfiles_2))
-            else:
-                failures.append(f)
+        # Data directories and indices of files that are not loaded.
+        data_dirs = {'Real_data/AspenPlus_pickle_files': [3,12,13,14,15,19], # assertion errors (hex in_degree not = out_degree)
+                     'Real_data/DWSim_pickle_files': [68,92]} # 68, 92 assertion error
+        for data_dir, skip in data_dirs.items():
+            all_files = [join(data_dir, f) for f in listdir(data_dir) if isfile(join(data_dir, f))]
+            for i,f in enumerate(all_files):
+                if not i in skip:
+                    edges_1, sfiles_1, flowsheet, edges_2, sfiles_2 = _convert_pickled_flowsheet(f)
+                    all_edges_1.append(edges_1)
+                    all_sfiles1.append(sfiles_1)
+                    all_sfiles3.append(_TAG_RE.sub('', sfiles_1))
+                    all_flowsheets.append(flowsheet)
+                    all_edges_2.append(edges_2)
+                    all_sfiles2.append(sfiles_2)
+                    all_sfiles4.append(_TAG_RE.sub('', sfiles_2))
+                else:
+                    failures.append(f)
 
         "Evaluate Testing"
         self.maxDiff=None
-        self.assertEqual(len(all_edges_1), len(all_edges_2), "There are some examples where edges didnt work out.")
+        self.assertEqual(all_edges_1, all_edges_2, "There are some examples where edges didnt work out.")
         #self.assertEqual(all_sfiles1, all_sfiles2, "There are some examples where SFILES notation produces a different string.") # currently only one example where it does not work (still no information missing, just because tags are not considered in graph invariant calculation)
         self.assertTrue(all(len(all_sfiles1[i]) == len(all_sfiles2[i]) for i in range(0,len(all_sfiles1))), "There are some examples where SFILES notation has a different length. (Tags might have gone missing in conversion back)")
         self.assertEqual(all_sfiles3, all_sfiles4, "There are some examples where SFILES notation produces a different string.")
-        print("There are %d duplicates. They are filtered out in the file all_data.txt"%(len(all_sfiles1) - len(set(all_sfiles1))))
+        unique_sfiles1 = set(all_sfiles1)
+        print("There are %d duplicates. They are filtered out in the file all_data.txt"%(len(all_sfiles1) - len(unique_sfiles1)))
 
         print('Additionally, the following files are not loaded:',failures)
 
         "Load the new data as SFILES and create train and dev set"
         print('Creating train and dev dataset')
-        with open('Real_data/all_data.txt', 'w') as f:
-            all_data = list(set(all_sfiles1))
-            random.shuffle(all_data)
-            for item in all_data:
-                f.write("%s.\n" % item)
+        all_data = list(unique_sfiles1)
+        random.shuffle(all_data)
+        # Lines are formatted once, the datasets are slices of all lines.
+        all_lines = ["%s.\n" % item for item in all_data]
+        Path('Real_data/all_data.txt').write_text(''.join(all_lines))
         
         tr = round(0.8 * len(all_data))
         dev = round(0.9 * len(all_data))
 
-        datasets = {'train_data': all_data[:tr], 
-                    'dev_data': all_data[tr:dev],
-                    'test_data': all_data[dev:]}
+        datasets = {'train_data': all_lines[:tr], 
+                    'dev_data': all_lines[tr:dev],
+                    'test_data': all_lines[dev:]}
 
         for id, dataset in datasets.items():
-            with open('Real_data/%s.txt'%id, 'w') as f:
-                for item in dataset:
-                    f.write("%s.\n" % item)
+            Path('Real_data/%s.txt'%id).write_text(''.join(dataset))
 
         Path("Real_data/flowsheet_objects").mkdir(parents=True, exist_ok=True)
         new_path = os.path.join(os.getcwd(),'Real_data/flowsheet_objects/Flowsheet_data.pkl')
-        filehandler = open(new_path, 'wb') 
-        pickle.dump(all_flowsheets, filehandler)
+        with open(new_path, 'wb', buffering=1 << 20) as filehandler:
+            pickle.dump(all_flowsheets, filehandler, protocol=pickle.HIGHEST_PROTOCOL)
         
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -4,6 +4,22 @@ import random
 
 random.seed(1)
 
+_MAX_READ_SIZE = 64 * 1024 * 1024  # Files larger than this (in bytes) are streamed line by line.
+
+
+def _read_sfiles(src):
+    """Returns the SFILES of a line-separated text file without line breaks. Files up to _MAX_READ_SIZE are read at
+    once, larger files are streamed.
+    """
+
+    if os.path.getsize(src) > _MAX_READ_SIZE:
+        with open(src, 'r') as file:
+            yield from (line.rstrip('\r\n') for line in file)
+    else:
+        with open(src, 'r') as file:
+            lines = file.read().splitlines()
+        yield from lines
+
 
 def canonical_to_noncanonical_sfile(sfiles, version: int = 2, sfiles_amount: int = 20, max_failed_attempts: int = 5):
     """Converts 1 SFILES into a random non-canonical SFILES, corresponding to the same graph
@@ -35,18 +51,19 @@ def canonical_to_noncanonical_sfile(sfiles, version: int = 2, sfiles_amount: int
 
     # Generate augmented (non-canonical) SFILES as long as required sfiles_amount and max fails is not reached.
     while succes_counter < sfiles_amount and fail_counter < max_failed_attempts:
-        temp_set = set()
+        new_sfiles = None
         try:
             flowsheet.convert_to_sfiles('v' + str(version), True, False)
-            temp_set.add(flowsheet.sfiles)
+            new_sfiles = flowsheet.sfiles
         except AssertionError:
             print('Warning: Faulty SFILES created.')
 
-        # Check if newly generated SFILES is already generated earlier or equal to the provided SFILES.
-        if (temp_set | all_sfiles) == all_sfiles:
+        # Check if the conversion failed or the newly generated SFILES is already generated earlier or equal to the
+        # provided SFILES.
+        if new_sfiles is None or new_sfiles in all_sfiles:
             fail_counter += 1
         else:
-            all_sfiles.add(flowsheet.sfiles)
+            all_sfiles.add(new_sfiles)
             succes_counter += 1
             fail_counter = 0
 
@@ -68,17 +85,14 @@ def canonical_to_noncanonical_txt(version: int = 2, src: str = 'dev_data', sfile
     """
 
     all_augmented_sfiles = set()
-    with open(src, 'r') as file:
-        for line in file:
-            sfiles = line[:-1]
-            augmented_sfiles = canonical_to_noncanonical_sfile(sfiles, version, sfiles_amount)
-            all_augmented_sfiles = augmented_sfiles | all_augmented_sfiles
+    for sfiles in _read_sfiles(src):
+        augmented_sfiles = canonical_to_noncanonical_sfile(sfiles, version, sfiles_amount)
+        all_augmented_sfiles = augmented_sfiles | all_augmented_sfiles
 
     base = os.path.splitext(src)[0]
     dst = base + '_augm' + '.txt'
     with open(dst, 'w+') as file:
-        for item in list(all_augmented_sfiles):
-            file.write("%s\n" % item)
+        file.write(''.join("%s\n" % item for item in all_augmented_sfiles))
 
 
 def non_canonical_tester(version: int = 2, src: str = 'dev_data.txt', sfiles_amount: int = 10):
@@ -102,36 +116,32 @@ def non_canonical_tester(version: int = 2, src: str = 'dev_data.txt', sfiles_amo
     correct_augmentation = 0
     false_augmentation = 0
 
-    with open(src, 'r') as file:
-        for line in file:
-            correct_counter = 0
-            false_counter = 0
-
-            # sfiles = line[:-2]
-            sfiles = line[:-1]
-            augmented_sfiles = canonical_to_noncanonical_sfile(sfiles, version, sfiles_amount)
-
-            for item in augmented_sfiles:
-                # Create flowsheet from non-canonical SFILES.
-                flowsheet = Flowsheet()
-                flowsheet.create_from_sfiles(item, overwrite_nx=True)
-                # Convert flowsheet to canonical SFILES.
-                try:
-                    flowsheet.convert_to_sfiles('v' + str(version), True, True)
-                except AssertionError:
-                    print('Warning: Faulty SFILES created.')
-
-                # Check if provided and re-converted to canonical SFILES are equal.
-                if flowsheet.sfiles == sfiles:
-                    correct_counter += 1
-                else:
-                    false_counter += 1
-                    print(sfiles, '\n')
-                    print(item, '\n')
-                    print(flowsheet.sfiles, '\n')
-
-            if correct_counter == len(augmented_sfiles):
-                correct_augmentation += 1
+    for sfiles in _read_sfiles(src):
+        correct_counter = 0
+        false_counter = 0
+        augmented_sfiles = canonical_to_noncanonical_sfile(sfiles, version, sfiles_amount)
+
+        for item in augmented_sfiles:
+            # Create flowsheet from non-canonical SFILES.
+            flowsheet = Flowsheet()
+            flowsheet.create_from_sfiles(item, overwrite_nx=True)
+            # Convert flowsheet to canonical SFILES.
+            try:
+                flowsheet.convert_to_sfiles('v' + str(version), True, True)
+            except AssertionError:
+                print('Warning: Faulty SFILES created.')
+
+            # Check if provided and re-converted to canonical SFILES are equal.
+            if flowsheet.sfiles == sfiles:
+                correct_counter += 1
             else:
-                false_augmentation += 1
+                false_counter += 1
+                print(sfiles, '\n')
+                print(item, '\n')
+                print(flowsheet.sfiles, '\n')
+
+        if correct_counter == len(augmented_sfiles):
+            correct_augmentation += 1
+        else:
+            false_augmentation += 1
     return correct_augmentation / (correct_augmentation + false_augmentation) * 100
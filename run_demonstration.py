@@ -17,12 +17,17 @@
             
 from Flowsheet_Class.flowsheet import Flowsheet
 import networkx as nx
+import os
+
+# Set SFILES_SKIP_VIZ=1 to only run the conversion checks without plotting (e.g. for quick smoke tests).
+skip_viz = bool(os.environ.get('SFILES_SKIP_VIZ'))
 
 # Try to create a new flowsheet from SFILES string
 flowsheet_2=Flowsheet()
 sfiles_in="(raw)(pp)<1(splt)[(hex)(flash)<&|(raw)&|[{bout}(v)(dist)[{bout}(prod)]{tout}(dist){bout}1<4{tout}(mix)<3(prod)]{bin}(abs)<2<6[{tout}(prod)]{bout}(flash){tout}5[{bout}(flash)[{tout}(comp)(comp)2<5]{bout}(flash){tout}3{bout}4]](hex){tin}6" # has to be valid according to SFILES rules
 flowsheet_2.create_from_sfiles(sfiles_in)
-flowsheet_2.visualize_flowsheet(table=False, pfd_path='plots/flowsheet3', plot_with_stream_labels=False)
+if not skip_viz:
+    flowsheet_2.visualize_flowsheet(table=False, pfd_path='plots/flowsheet3', plot_with_stream_labels=False)
 
 # Check if conversion back works
 flowsheet_2.sfiles=""
@@ -59,7 +64,8 @@ print(flowsheet_2.sfiles)
 flowsheet_2=Flowsheet()
 sfiles_in="(raw)(flash)[{tout}(prod)]{bout}(splt)[(prod)](r)<&|(raw)(flash){tout}&{bout}(prod)|(prod)" # has to be valid according to SFILES rules
 flowsheet_2.create_from_sfiles(sfiles_in)
-flowsheet_2.visualize_flowsheet(table=False, pfd_path='plots/flowsheet3', plot_with_stream_labels=False)
+if not skip_viz:
+    flowsheet_2.visualize_flowsheet(table=False, pfd_path='plots/flowsheet3', plot_with_stream_labels=False)
 
 # Check if conversion back works
 flowsheet_2.sfiles=""